@@ -1,18 +1,44 @@
+import asyncio
+import hashlib
+import hmac
+import logging
 import os
-import uuid
-import shutil
-import subprocess
+import queue
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlparse
+import aiofiles
 import boto3
-import requests
+import httpx
+import redis.asyncio as redis
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks, Query, Body
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, HttpUrl
+from uuid6 import uuid7
 
 app = FastAPI(title="Auto-Editor API", version="1.0.0")
 
+# Logging goes through a queue: emitting a record is an O(1) enqueue and the
+# actual stream write happens on the listener's thread, so a multi-KB stderr
+# dump from a failed job never stalls the event loop
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+
+logger = logging.getLogger(__name__)
+logger.addHandler(QueueHandler(_log_queue))
+logger.setLevel(os.getenv("LOG_LEVEL", "WARNING"))
+
 # Wasabi Configuration
 WASABI_ACCESS_KEY = os.getenv("WASABI_ACCESS_KEY")
 WASABI_SECRET_KEY = os.getenv("WASABI_SECRET_KEY")
@@ -32,10 +58,95 @@ if WASABI_ENABLED:
         region_name=WASABI_REGION
     )
 
-UPLOAD_DIR = Path("/tmp/uploads")
-OUTPUT_DIR = Path("/tmp/outputs")
-UPLOAD_DIR.mkdir(exist_ok=True)
-OUTPUT_DIR.mkdir(exist_ok=True)
+# Upload files above 16 MiB as concurrent multipart parts so a large edited
+# video saturates the egress link instead of trickling over one connection
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=min(os.cpu_count() or 1, 16),
+    use_threads=True
+)
+
+def _resolve_auto_editor() -> str:
+    """Locate the native auto-editor binary bundled with the package.
+
+    Since auto-editor 29 the PyPI package is a thin launcher: the
+    `auto-editor` console script starts a fresh Python interpreter whose only
+    job is to exec a vendored native binary. Resolving that binary once at
+    import time skips the interpreter startup and launcher imports on every
+    job. Falls back to the CLI entry point if the package layout changes or
+    the binary has not been downloaded yet.
+    """
+    try:
+        import auto_editor
+        from auto_editor.__main__ import get_binary_info
+
+        _, local_name, _ = get_binary_info()
+        binary = Path(auto_editor.__file__).parent / "bin" / local_name
+        if binary.exists():
+            return str(binary)
+    except Exception as e:
+        logger.warning(f"Could not resolve auto-editor binary, using CLI: {e}")
+    return "auto-editor"
+
+AUTO_EDITOR_BIN = _resolve_auto_editor()
+
+# Fixed argv prefix shared by every job; per-job flags are appended once below
+BASE_CMD = (AUTO_EDITOR_BIN,)
+
+# Outputs at or below this size skip the Wasabi round-trip and are served
+# from local disk through /signed/{job_id} with an HMAC-signed URL. Requires
+# LOCAL_URL_SIGNING_KEY (shared across workers) to be set; disabled otherwise.
+LOCAL_URL_KEY = os.getenv("LOCAL_URL_SIGNING_KEY", "").encode()
+SMALL_OUTPUT_MAX_BYTES = int(os.getenv("SMALL_OUTPUT_MAX_BYTES", 32 * 1024 * 1024))
+
+# Keep only the tail of auto-editor's stderr; verbose ffmpeg output on a long
+# video can otherwise buffer many MB per job
+STDERR_TAIL_BYTES = 64 * 1024
+
+async def _read_stderr_tail(stream) -> bytes:
+    """Drain a subprocess stderr pipe keeping only the last STDERR_TAIL_BYTES"""
+    tail = deque()
+    size = 0
+    while chunk := await stream.read(4096):
+        tail.append(chunk)
+        size += len(chunk)
+        while size > STDERR_TAIL_BYTES and len(tail) > 1:
+            size -= len(tail.popleft())
+    return b"".join(tail)
+
+# Cap concurrent auto-editor subprocesses: each one spawns ffmpeg and many
+# threads, so unbounded parallelism OOMs the host instead of adding throughput
+AE_CONCURRENCY = int(os.getenv("AE_CONCURRENCY", max(1, (os.cpu_count() or 2) // 2)))
+ae_semaphore = asyncio.Semaphore(AE_CONCURRENCY)
+
+# Shared HTTP client for URL downloads: keep-alive connections are reused
+# across jobs (no TCP+TLS handshake per download) and HTTP/2 multiplexes
+# requests to the same CDN/S3 origin
+http_client = httpx.AsyncClient(
+    http2=True,
+    follow_redirects=True,
+    timeout=300,
+    limits=httpx.Limits(max_connections=128, max_keepalive_connections=32)
+)
+
+# Redis Configuration (shared job store, required for multi-worker deployments)
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# Job records expire together with the Wasabi presigned URL (12 hours)
+JOB_TTL_SECONDS = 43200
+
+# Copy loops move data in 1 MiB chunks: large enough to amortize the
+# per-chunk syscall and event-loop round-trip, small enough to keep
+# memory per in-flight transfer bounded
+CHUNK_SIZE = 1 << 20
+
+# Scratch space for inputs and staged outputs; point these at a tmpfs mount
+# so the short-lived video files never touch disk (see README)
+UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "/tmp/uploads"))
+OUTPUT_DIR = Path(os.getenv("OUTPUT_DIR", "/tmp/outputs"))
+UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 class ProcessingStatus(BaseModel):
     job_id: str
@@ -43,6 +154,7 @@ class ProcessingStatus(BaseModel):
     message: Optional[str] = None
     output_file: Optional[str] = None
     wasabi_url: Optional[str] = None
+    download_url: Optional[str] = None
 
 class ProcessVideoFromUrl(BaseModel):
     url: str = Field(..., description="URL of the video file to process")
@@ -50,26 +162,75 @@ class ProcessVideoFromUrl(BaseModel):
     edit_mode: Optional[str] = Field(None, description="Edit mode: 'audio', 'motion', 'subtitle'")
     threshold: Optional[float] = Field(None, description="Threshold value for edit mode")
 
+@dataclass(slots=True)
+class JobRecord:
+    """Fixed-layout job record mirrored into a Redis hash.
+
+    slots gives a compact fixed C layout instead of a per-job dict, and
+    attribute access catches typos that dict keys would let through.
+    """
+    status: str
+    message: str = ""
+    output_file: Optional[str] = None
+    wasabi_url: Optional[str] = None
+    download_url: Optional[str] = None
+
+    def to_mapping(self) -> dict:
+        fields = {"status": self.status, "message": self.message}
+        if self.output_file:
+            fields["output_file"] = self.output_file
+        if self.wasabi_url:
+            fields["wasabi_url"] = self.wasabi_url
+        if self.download_url:
+            fields["download_url"] = self.download_url
+        return fields
+
+    @classmethod
+    def from_mapping(cls, mapping: dict) -> "JobRecord":
+        return cls(
+            status=mapping.get("status", "unknown"),
+            message=mapping.get("message", ""),
+            output_file=mapping.get("output_file"),
+            wasabi_url=mapping.get("wasabi_url"),
+            download_url=mapping.get("download_url")
+        )
+
 class JobStore:
-    def __init__(self):
-        self.jobs = {}
+    """Job state persisted in Redis so any worker can serve any job.
+
+    Each job is a Redis hash (job:{job_id}) with a TTL matching the
+    presigned-URL lifetime, so completed jobs expire instead of leaking.
+    """
+
+    def __init__(self, url: str):
+        self.redis = redis.Redis.from_url(url, decode_responses=True)
 
-    def add_job(self, job_id: str, status: str, message: str = ""):
-        self.jobs[job_id] = {"status": status, "message": message, "output_file": None, "wasabi_url": None}
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"job:{job_id}"
 
-    def update_job(self, job_id: str, status: str, message: str = "", output_file: str = None, wasabi_url: str = None):
-        if job_id in self.jobs:
-            self.jobs[job_id]["status"] = status
-            self.jobs[job_id]["message"] = message
-            if output_file:
-                self.jobs[job_id]["output_file"] = output_file
-            if wasabi_url:
-                self.jobs[job_id]["wasabi_url"] = wasabi_url
+    async def add_job(self, job_id: str, status: str, message: str = ""):
+        key = self._key(job_id)
+        await self.redis.hset(key, mapping=JobRecord(status, message).to_mapping())
+        await self.redis.expire(key, JOB_TTL_SECONDS)
 
-    def get_job(self, job_id: str):
-        return self.jobs.get(job_id)
+    async def update_job(self, job_id: str, status: str, message: str = "", output_file: str = None,
+                         wasabi_url: str = None, download_url: str = None):
+        key = self._key(job_id)
+        record = JobRecord(status, message, output_file, wasabi_url, download_url)
+        await self.redis.hset(key, mapping=record.to_mapping())
+        await self.redis.expire(key, JOB_TTL_SECONDS)
 
-job_store = JobStore()
+    async def get_job(self, job_id: str) -> Optional[JobRecord]:
+        job = await self.redis.hgetall(self._key(job_id))
+        if not job:
+            return None
+        return JobRecord.from_mapping(job)
+
+    async def delete_job(self, job_id: str):
+        await self.redis.delete(self._key(job_id))
+
+job_store = JobStore(REDIS_URL)
 
 def cleanup_file(path: Path):
     """Background task to cleanup files after download"""
@@ -77,105 +238,208 @@ def cleanup_file(path: Path):
         if path.exists():
             path.unlink()
     except Exception as e:
-        print(f"Error cleaning up {path}: {e}")
+        logger.warning(f"Error cleaning up {path}: {e}")
+
+async def download_video_from_url(url: str, output_path: Path) -> Optional[str]:
+    """Download video from URL to local file.
 
-def download_video_from_url(url: str, output_path: Path) -> bool:
-    """Download video from URL to local file"""
+    Returns the content hash of the downloaded bytes, or None on failure.
+    """
     try:
-        response = requests.get(url, stream=True, timeout=300)
-        response.raise_for_status()
-
-        with output_path.open('wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-
-        return True
-    except requests.exceptions.RequestException as e:
-        print(f"Error downloading video from URL: {e}")
-        return False
+        hasher = hashlib.blake2b()
+
+        async with http_client.stream("GET", url) as response:
+            response.raise_for_status()
+
+            async with aiofiles.open(output_path, "wb") as f:
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    hasher.update(chunk)
+                    await f.write(chunk)
+
+        return hasher.hexdigest()
+    except httpx.HTTPError as e:
+        logger.error(f"Error downloading video from URL: {e}")
+        return None
     except Exception as e:
-        print(f"Unexpected error downloading video: {e}")
-        return False
+        logger.error(f"Unexpected error downloading video: {e}")
+        return None
+
+@lru_cache(maxsize=4096)
+def _presign_url(s3_key: str, epoch_hour: int) -> str:
+    """Generate a presigned GET URL for an object, memoized per hour.
+
+    Each presigned URL costs an HMAC-SHA256 signature plus botocore request
+    serialization; repeated requests for the same object (status polling,
+    cache hits) reuse the cached URL. The epoch_hour argument rolls the cache
+    over hourly, so a returned URL always has well over 11 of its 12 hours of
+    validity left.
+    """
+    return s3_client.generate_presigned_url(
+        'get_object',
+        Params={
+            'Bucket': WASABI_BUCKET,
+            'Key': s3_key
+        },
+        ExpiresIn=43200  # 12 hours
+    )
+
+def _s3_key(job_id: str, file_name: str) -> str:
+    return f"edited-videos/{job_id}/{file_name}"
+
+def _hash_file(path: Path) -> str:
+    """Content hash of a file already on disk (for the sendfile upload path)"""
+    hasher = hashlib.blake2b()
+    with path.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def _result_cache_key(content_hash: str, margin: Optional[str],
+                      edit_mode: Optional[str], threshold: Optional[float]) -> str:
+    return f"cache:{content_hash}:{margin}:{edit_mode}:{threshold}"
+
+async def get_cached_result_url(cache_key: str) -> Optional[str]:
+    """Fresh presigned URL for a cached result, or None on cache miss.
+
+    Results are memoized in Redis by (content hash, edit parameters) and point
+    at the Wasabi object produced the first time those exact bytes were
+    processed, so identical re-submissions skip auto-editor entirely.
+    """
+    if not (WASABI_ENABLED and s3_client):
+        return None
+
+    s3_key = await job_store.redis.get(cache_key)
+    if not s3_key:
+        return None
+
+    return await asyncio.to_thread(_presign_url, s3_key, int(time.time()) // 3600)
+
+def _sign_local_token(job_id: str, exp: int) -> str:
+    return hmac.new(LOCAL_URL_KEY, f"{job_id}|{exp}".encode(), "sha256").hexdigest()
+
+def _signed_local_url(job_id: str) -> str:
+    """Time-limited HMAC-signed URL for an output kept on local disk"""
+    exp = int(time.time()) + JOB_TTL_SECONDS
+    return f"/signed/{job_id}?exp={exp}&sig={_sign_local_token(job_id, exp)}"
 
-def upload_to_wasabi(file_path: Path, job_id: str) -> Optional[str]:
+def _sendfile_copy(src_fd: int, dst_path: Path):
+    """Copy an on-disk upload into dst_path with sendfile(2).
+
+    The copy happens entirely in kernel space, skipping the two user-space
+    buffer hops a read/write loop pays per chunk.
+    """
+    size = os.fstat(src_fd).st_size
+    with dst_path.open("wb") as dst:
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst.fileno(), src_fd, offset, CHUNK_SIZE)
+            if sent == 0:
+                break
+            offset += sent
+
+async def upload_to_wasabi(file_path: Path, job_id: str) -> Optional[str]:
     """Upload file to Wasabi and return a presigned URL (valid for 12 hours)"""
     if not WASABI_ENABLED or not s3_client:
         return None
 
     try:
-        file_name = file_path.name
-        s3_key = f"edited-videos/{job_id}/{file_name}"
+        s3_key = _s3_key(job_id, file_path.name)
 
+        # boto3 is synchronous; run each call on the (bounded) thread pool so
+        # the event loop stays free for the duration of the transfer
         # Upload file (private, no public access)
-        s3_client.upload_file(
+        await asyncio.to_thread(
+            s3_client.upload_file,
             str(file_path),
             WASABI_BUCKET,
-            s3_key
+            s3_key,
+            Config=TRANSFER_CONFIG
         )
 
         # Generate presigned URL valid for 12 hours (43200 seconds)
-        presigned_url = s3_client.generate_presigned_url(
-            'get_object',
-            Params={
-                'Bucket': WASABI_BUCKET,
-                'Key': s3_key
-            },
-            ExpiresIn=43200  # 12 hours
-        )
+        presigned_url = await asyncio.to_thread(_presign_url, s3_key, int(time.time()) // 3600)
 
         return presigned_url
 
     except ClientError as e:
-        print(f"Error uploading to Wasabi: {e}")
+        logger.error(f"Error uploading to Wasabi: {e}")
         return None
     except Exception as e:
-        print(f"Unexpected error during Wasabi upload: {e}")
+        logger.error(f"Unexpected error during Wasabi upload: {e}")
         return None
 
-def process_video(job_id: str, input_path: Path, output_path: Path, margin: Optional[str],
-                  edit_mode: Optional[str], threshold: Optional[float]):
+async def process_video(job_id: str, input_path: Path, output_path: Path, margin: Optional[str],
+                        edit_mode: Optional[str], threshold: Optional[float],
+                        cache_key: Optional[str] = None):
     """Process video using auto-editor"""
     try:
-        cmd = ["auto-editor", str(input_path), "-o", str(output_path)]
+        cmd = [*BASE_CMD, str(input_path), "-o", str(output_path)]
 
         if margin:
-            cmd.extend(["--margin", margin])
+            cmd += ("--margin", margin)
 
         if edit_mode:
-            if threshold:
-                cmd.extend(["--edit", f"{edit_mode}:threshold={threshold}"])
-            else:
-                cmd.extend(["--edit", edit_mode])
-
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
-
-        if result.returncode == 0:
+            cmd.append("--edit")
+            cmd.append(f"{edit_mode}:threshold={threshold}" if threshold else edit_mode)
+
+        async with ae_semaphore:
+            # stdout is never read, so drop it; stderr is drained into a
+            # bounded tail so a failing job still gets a useful message
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stderr_task = asyncio.create_task(_read_stderr_tail(proc.stderr))
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=3600)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                stderr_task.cancel()
+                raise
+            stderr = await stderr_task
+
+        if proc.returncode == 0:
+            # Small outputs skip the Wasabi round-trip: the upload + presigned
+            # download would cost more than serving the file from local disk
+            # behind an HMAC-signed URL
+            small_output = (LOCAL_URL_KEY
+                            and output_path.stat().st_size <= SMALL_OUTPUT_MAX_BYTES)
             # Upload to Wasabi if configured
             wasabi_url = None
-            if WASABI_ENABLED:
-                wasabi_url = upload_to_wasabi(output_path, job_id)
+            if WASABI_ENABLED and small_output:
+                await job_store.update_job(job_id, "completed",
+                                           "Video processed (served locally via signed URL)",
+                                           str(output_path), download_url=_signed_local_url(job_id))
+            elif WASABI_ENABLED:
+                wasabi_url = await upload_to_wasabi(output_path, job_id)
                 if wasabi_url:
-                    job_store.update_job(job_id, "completed", "Video processed and uploaded to Wasabi (presigned URL valid for 12 hours)",
-                                       str(output_path), wasabi_url)
+                    await job_store.update_job(job_id, "completed", "Video processed and uploaded to Wasabi (presigned URL valid for 12 hours)",
+                                               str(output_path), wasabi_url)
+                    # Remember the result so identical input + parameters skip
+                    # auto-editor next time
+                    if cache_key:
+                        await job_store.redis.set(cache_key, _s3_key(job_id, output_path.name),
+                                                  ex=JOB_TTL_SECONDS)
                     # Delete local output file after successful Wasabi upload to save disk space
                     try:
                         output_path.unlink()
-                        print(f"Deleted local file after Wasabi upload: {output_path}")
+                        logger.info(f"Deleted local file after Wasabi upload: {output_path}")
                     except Exception as e:
-                        print(f"Failed to delete local file: {e}")
+                        logger.warning(f"Failed to delete local file: {e}")
                 else:
-                    job_store.update_job(job_id, "completed", "Video processed (Wasabi upload failed)",
-                                       str(output_path))
+                    await job_store.update_job(job_id, "completed", "Video processed (Wasabi upload failed)",
+                                               str(output_path))
             else:
-                job_store.update_job(job_id, "completed", "Video processed successfully", str(output_path))
+                await job_store.update_job(job_id, "completed", "Video processed successfully", str(output_path))
         else:
-            job_store.update_job(job_id, "failed", f"Auto-editor error: {result.stderr}")
+            await job_store.update_job(job_id, "failed", f"Auto-editor error: {stderr.decode(errors='replace')}")
 
-    except subprocess.TimeoutExpired:
-        job_store.update_job(job_id, "failed", "Processing timeout (>1 hour)")
+    except asyncio.TimeoutError:
+        await job_store.update_job(job_id, "failed", "Processing timeout (>1 hour)")
     except Exception as e:
-        job_store.update_job(job_id, "failed", f"Processing error: {str(e)}")
+        await job_store.update_job(job_id, "failed", f"Processing error: {str(e)}")
     finally:
         # Cleanup input file
         try:
@@ -183,6 +447,40 @@ def process_video(job_id: str, input_path: Path, output_path: Path, margin: Opti
         except:
             pass
 
+async def download_and_process(job_id: str, url: str, input_path: Path, output_path: Path,
+                               margin: Optional[str], edit_mode: Optional[str], threshold: Optional[float]):
+    """Background task: download the source video, then hand it to process_video"""
+    content_hash = await download_video_from_url(url, input_path)
+    if content_hash is None:
+        await job_store.update_job(job_id, "failed", "Failed to download video from URL")
+        return
+
+    # Identical bytes with identical parameters were already processed:
+    # reuse the cached Wasabi object instead of re-running auto-editor
+    cache_key = _result_cache_key(content_hash, margin, edit_mode, threshold)
+    cached_url = await get_cached_result_url(cache_key)
+    if cached_url:
+        await job_store.update_job(job_id, "completed",
+                                   "Video served from result cache (presigned URL valid for 12 hours)",
+                                   wasabi_url=cached_url)
+        cleanup_file(input_path)
+        return
+
+    await job_store.update_job(job_id, "processing", "Video downloaded, processing started")
+    await process_video(job_id, input_path, output_path, margin, edit_mode, threshold, cache_key)
+
+@app.on_event("startup")
+async def configure_executor():
+    # Bound the default thread pool used by asyncio.to_thread so blocking
+    # boto3/file work queues up instead of spawning unbounded threads
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=4 * AE_CONCURRENCY))
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await http_client.aclose()
+    _log_listener.stop()
+
 @app.get("/")
 async def root():
     return {
@@ -192,7 +490,8 @@ async def root():
             "POST /process": "Upload and process a video",
             "POST /process-url": "Process a video from URL",
             "GET /status/{job_id}": "Check processing status",
-            "GET /download/{job_id}": "Download processed video"
+            "GET /download/{job_id}": "Download processed video",
+            "GET /stream/{job_id}": "Stream processed video (local or proxied from Wasabi)"
         }
     }
 
@@ -221,7 +520,9 @@ async def process_video_endpoint(
         raise HTTPException(status_code=400, detail="No filename provided")
 
     # Generate job ID
-    job_id = str(uuid.uuid4())
+    # Time-ordered ids cluster recent jobs together in Redis and let admin
+    # tooling find recent work with a prefix SCAN instead of a full keyspace walk
+    job_id = str(uuid7())
 
     # Save uploaded file
     file_ext = Path(file.filename).suffix
@@ -229,14 +530,50 @@ async def process_video_endpoint(
     output_path = OUTPUT_DIR / f"{job_id}_output{file_ext}"
 
     try:
-        with input_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Large uploads have already been spooled to disk by Starlette; copy
+        # those in kernel space with sendfile instead of looping through
+        # user-space buffers
+        src_fd = None
+        if getattr(file.file, "_rolled", False):
+            try:
+                src_fd = file.file.fileno()
+            except (AttributeError, OSError, ValueError):
+                src_fd = None
+
+        if src_fd is not None:
+            await asyncio.to_thread(_sendfile_copy, src_fd, input_path)
+            content_hash = await asyncio.to_thread(_hash_file, input_path)
+        else:
+            # Still in memory (or no real fd): stream to disk in large chunks
+            # so the event loop is never blocked for the duration of the upload,
+            # hashing the bytes as they pass through
+            hasher = hashlib.blake2b()
+            async with aiofiles.open(input_path, "wb") as f:
+                while chunk := await file.read(CHUNK_SIZE):
+                    hasher.update(chunk)
+                    await f.write(chunk)
+            content_hash = hasher.hexdigest()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving file: {str(e)}")
 
+    # Identical bytes with identical parameters were already processed:
+    # reuse the cached Wasabi object instead of re-running auto-editor
+    cache_key = _result_cache_key(content_hash, margin, edit_mode, threshold)
+    cached_url = await get_cached_result_url(cache_key)
+    if cached_url:
+        message = "Video served from result cache (presigned URL valid for 12 hours)"
+        await job_store.update_job(job_id, "completed", message, wasabi_url=cached_url)
+        cleanup_file(input_path)
+        return ProcessingStatus(
+            job_id=job_id,
+            status="completed",
+            message=message,
+            wasabi_url=cached_url
+        )
+
     # Create job and start processing
-    job_store.add_job(job_id, "processing", "Video is being processed")
-    background_tasks.add_task(process_video, job_id, input_path, output_path, margin, edit_mode, threshold)
+    await job_store.add_job(job_id, "processing", "Video is being processed")
+    background_tasks.add_task(process_video, job_id, input_path, output_path, margin, edit_mode, threshold, cache_key)
 
     return ProcessingStatus(
         job_id=job_id,
@@ -262,67 +599,61 @@ async def process_video_from_url_endpoint(
     """
 
     # Generate job ID
-    job_id = str(uuid.uuid4())
+    job_id = str(uuid7())
 
-    # Determine file extension from URL
-    url_path = Path(request.url)
-    file_ext = url_path.suffix if url_path.suffix else ".mp4"
+    # Determine file extension from the URL path only (ignoring query string
+    # and fragment, which Path.suffix would misparse)
+    file_ext = os.path.splitext(urlparse(request.url).path)[1] or ".mp4"
 
     input_path = UPLOAD_DIR / f"{job_id}_input{file_ext}"
     output_path = OUTPUT_DIR / f"{job_id}_output{file_ext}"
 
-    # Create job
-    job_store.add_job(job_id, "downloading", "Downloading video from URL")
-
-    # Download video
-    if not download_video_from_url(request.url, input_path):
-        job_store.update_job(job_id, "failed", "Failed to download video from URL")
-        raise HTTPException(status_code=400, detail="Failed to download video from URL")
-
-    # Update job status and start processing
-    job_store.update_job(job_id, "processing", "Video downloaded, processing started")
-    background_tasks.add_task(process_video, job_id, input_path, output_path,
-                             request.margin, request.edit_mode, request.threshold)
+    # Create job; the download itself runs in the background so the client
+    # gets the job_id back immediately instead of waiting out the transfer
+    await job_store.add_job(job_id, "downloading", "Downloading video from URL")
+    background_tasks.add_task(download_and_process, job_id, request.url, input_path, output_path,
+                              request.margin, request.edit_mode, request.threshold)
 
     return ProcessingStatus(
         job_id=job_id,
-        status="processing",
+        status="downloading",
         message="Video download started and will be processed"
     )
 
 @app.get("/status/{job_id}", response_model=ProcessingStatus)
 async def get_status(job_id: str):
     """Check the status of a processing job"""
-    job = job_store.get_job(job_id)
+    job = await job_store.get_job(job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
     return ProcessingStatus(
         job_id=job_id,
-        status=job["status"],
-        message=job["message"],
-        output_file=job["output_file"],
-        wasabi_url=job.get("wasabi_url")
+        status=job.status,
+        message=job.message,
+        output_file=job.output_file,
+        wasabi_url=job.wasabi_url,
+        download_url=job.download_url
     )
 
 @app.get("/download/{job_id}")
 async def download_video(job_id: str, background_tasks: BackgroundTasks):
     """Download the processed video (if available locally)"""
-    job = job_store.get_job(job_id)
+    job = await job_store.get_job(job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    if job["status"] != "completed":
-        raise HTTPException(status_code=400, detail=f"Job status: {job['status']}")
+    if job.status != "completed":
+        raise HTTPException(status_code=400, detail=f"Job status: {job.status}")
 
-    output_file = Path(job["output_file"]) if job.get("output_file") else None
+    output_file = Path(job.output_file) if job.output_file else None
 
     # Check if file exists locally
     if not output_file or not output_file.exists():
         # If Wasabi URL is available, inform user
-        if job.get("wasabi_url"):
+        if job.wasabi_url:
             raise HTTPException(
                 status_code=410,
                 detail="Local file has been removed after Wasabi upload. Please use the wasabi_url from the status endpoint."
@@ -339,23 +670,93 @@ async def download_video(job_id: str, background_tasks: BackgroundTasks):
         media_type="video/mp4"
     )
 
+@app.get("/signed/{job_id}")
+async def download_signed(job_id: str, exp: int, sig: str):
+    """Download a locally stored output via an HMAC-signed URL"""
+    if not LOCAL_URL_KEY:
+        raise HTTPException(status_code=404, detail="Signed URLs are not enabled")
+
+    if exp < int(time.time()):
+        raise HTTPException(status_code=403, detail="Signed URL expired")
+
+    if not hmac.compare_digest(sig, _sign_local_token(job_id, exp)):
+        raise HTTPException(status_code=403, detail="Invalid signature")
+
+    job = await job_store.get_job(job_id)
+
+    if not job or not job.output_file:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    output_file = Path(job.output_file)
+
+    if not output_file.exists():
+        raise HTTPException(status_code=404, detail="Output file not found")
+
+    return FileResponse(
+        path=output_file,
+        filename=f"edited_{output_file.name}",
+        media_type="video/mp4"
+    )
+
+@app.get("/stream/{job_id}")
+async def stream_video(job_id: str):
+    """Stream the processed video, proxying from Wasabi if the local copy is gone"""
+    job = await job_store.get_job(job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if job.status != "completed":
+        raise HTTPException(status_code=400, detail=f"Job status: {job.status}")
+
+    output_file = Path(job.output_file) if job.output_file else None
+
+    # Serve the local file when it still exists; FileResponse uses sendfile
+    # under uvicorn, so the disk-to-socket copy stays in the kernel
+    if output_file and output_file.exists():
+        return FileResponse(
+            path=output_file,
+            filename=f"edited_{output_file.name}",
+            media_type="video/mp4"
+        )
+
+    # Otherwise proxy the object straight from Wasabi without re-spooling
+    # it to local disk
+    if not (WASABI_ENABLED and s3_client and job.wasabi_url and output_file):
+        raise HTTPException(status_code=404, detail="Output file not found")
+
+    try:
+        obj = await asyncio.to_thread(s3_client.get_object, Bucket=WASABI_BUCKET,
+                                      Key=_s3_key(job_id, output_file.name))
+    except ClientError:
+        raise HTTPException(status_code=404, detail="Output file not found in Wasabi")
+
+    return StreamingResponse(
+        obj["Body"].iter_chunks(CHUNK_SIZE),
+        media_type="video/mp4",
+        headers={
+            "Content-Length": str(obj["ContentLength"]),
+            "Content-Disposition": f'attachment; filename="edited_{output_file.name}"'
+        }
+    )
+
 @app.delete("/cleanup/{job_id}")
 async def cleanup_job(job_id: str):
     """Manually cleanup job files"""
-    job = job_store.get_job(job_id)
+    job = await job_store.get_job(job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
     # Remove output file if exists
-    if job["output_file"]:
+    if job.output_file:
         try:
-            Path(job["output_file"]).unlink()
+            Path(job.output_file).unlink()
         except:
             pass
 
     # Remove from job store
-    del job_store.jobs[job_id]
+    await job_store.delete_job(job_id)
 
     return {"message": "Job cleaned up successfully"}
 